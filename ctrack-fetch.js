@@ -26,6 +26,7 @@ function parseArgs() {
     allDocs: false,
     opinionsOnly: false,
     timeout: 90000,
+    jobs: 4,
     help: false,
   };
 
@@ -79,6 +80,17 @@ function parseArgs() {
         console.error('Error: -t/--timeout requires a number of seconds');
         process.exit(1);
       }
+    } else if (arg === '-j' || arg === '--jobs') {
+      if (i + 1 < args.length) {
+        options.jobs = parseInt(args[++i], 10);
+        if (isNaN(options.jobs) || options.jobs < 1) {
+          console.error('Error: -j/--jobs requires a positive number');
+          process.exit(1);
+        }
+      } else {
+        console.error('Error: -j/--jobs requires a number');
+        process.exit(1);
+      }
     } else if (arg === '-a' || arg === '--all') {
       options.allDocs = true;
     } else if (arg === '-O' || arg === '--opinions') {
@@ -119,6 +131,7 @@ Options:
   -a, --all           Download all documents (not just briefs/NOA)
   -O, --opinions      Download only opinions (incl. corrected/amended); overrides -a
   -t, --timeout N     Per-request HTTP timeout in seconds (default: 90)
+  -j, --jobs N        Documents to fetch concurrently per case (default: 4)
 
 Examples:
   node ctrack-fetch.js                     # Download briefs for next 7 days
@@ -153,6 +166,7 @@ const CONFIG = {
   allDocs: parsedArgs.allDocs,
   opinionsOnly: parsedArgs.opinionsOnly,
   timeout: parsedArgs.timeout,
+  jobs: parsedArgs.jobs,
 };
 
 // The exact-match case-number search type used by the cTrack search form.
@@ -179,6 +193,40 @@ function progress(message) {
 
 const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
 
+/**
+ * Write `data` to `filePath` via a temporary file in the same directory and
+ * an atomic rename, so an interrupted run never leaves a truncated file under
+ * the final name.
+ */
+function writeFileAtomic(filePath, data) {
+  const tmpPath = `${filePath}.${process.pid}.part`;
+  try {
+    fs.writeFileSync(tmpPath, data);
+    fs.renameSync(tmpPath, filePath);
+  } catch (e) {
+    fs.rmSync(tmpPath, { force: true });
+    throw e;
+  }
+}
+
+/**
+ * Map `fn` over `items` with at most `limit` calls in flight. Results keep
+ * the order of `items`. `fn` is expected to handle its own errors.
+ */
+async function mapConcurrent(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  async function worker() {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i], i);
+    }
+  }
+  const workers = Array.from({ length: Math.min(limit, items.length) }, worker);
+  await Promise.all(workers);
+  return results;
+}
+
 // Brief type mapping - maps common brief names to abbreviations
 const BRIEF_TYPE_MAP = {
   // Appellant briefs
@@ -241,6 +289,11 @@ const BRIEF_TYPE_MAP = {
   'notice appeal': 'Notice-of-Appeal',
 };
 
+// Partial-match patterns, longest first so specific names win. Sorted once
+// here rather than on every abbreviateBriefType call.
+const BRIEF_TYPE_PATTERNS = Object.entries(BRIEF_TYPE_MAP)
+  .sort((a, b) => b[0].length - a[0].length);
+
 /**
  * Convert a brief name from the docket to our abbreviated format.
  * `subtype` is the docket's Subtype column; for opinions it is "Opinion",
@@ -274,9 +327,7 @@ function abbreviateBriefType(briefName, subtype = '') {
   }
 
   // Check for partial matches (longer patterns first to prefer specific matches)
-  const sortedEntries = Object.entries(BRIEF_TYPE_MAP)
-    .sort((a, b) => b[0].length - a[0].length);
-  for (const [pattern, abbrev] of sortedEntries) {
+  for (const [pattern, abbrev] of BRIEF_TYPE_PATTERNS) {
     if (normalized.includes(pattern)) {
       return abbrev;
     }
@@ -309,18 +360,21 @@ function formatCaseNumber(caseNum) {
   return cleaned;
 }
 
+// Characters that are illegal in a filename on at least one platform. Free-form
+// docket descriptions can contain path separators (e.g. "and/or") and other
+// unsafe characters that would otherwise break the write.
+const ILLEGAL_FILENAME_CHARS = /[\/\\:*?"<>|\x00-\x1f]/g;
+
 /**
- * Generate filename for a brief or document
- * Format: {caseNumber}_{docketId}_{docType}.pdf
+ * Generate filename for a brief or document from its abbreviated type
+ * (see abbreviateBriefType).
+ * Format: {caseNumber}_{docketId}_{briefType}.pdf
  */
-function generateFilename(caseNumber, docketId, docType, index = null, subtype = '') {
+function generateFilename(caseNumber, docketId, briefType, index = null) {
   const formattedCase = formatCaseNumber(caseNumber);
   const paddedDocketId = String(docketId).padStart(3, '0');
-  // Strip characters that are illegal in a filename. Free-form docket
-  // descriptions can contain path separators (e.g. "and/or") and other
-  // unsafe characters that would otherwise break the write.
-  const abbrevType = abbreviateBriefType(docType, subtype)
-    .replace(/[\/\\:*?"<>|\x00-\x1f]/g, '-')
+  const abbrevType = briefType
+    .replace(ILLEGAL_FILENAME_CHARS, '-')
     .replace(/-+/g, '-')
     .replace(/^-|-$/g, '');
   const suffix = index !== null ? index : '';
@@ -485,7 +539,7 @@ async function downloadDocument(caseUuid, documentLinkUuid, filename) {
   }
 
   const filePath = path.join(CONFIG.downloadDir, filename);
-  fs.writeFileSync(filePath, buffer);
+  writeFileAtomic(filePath, buffer);
   return { url, size: buffer.length };
 }
 
@@ -577,62 +631,73 @@ async function processCase(caseInfo, downloadedBriefs, manifest) {
     return 0;
   }
 
-  let downloaded = 0;
-  for (const entry of wanted) {
-    let links;
+  // Each docket entry and each document is independent, so the network work
+  // runs with bounded concurrency (-j). Filenames are still assigned in
+  // docket order so duplicate suffixes and the manifest stay deterministic.
+  const linkLists = await mapConcurrent(wanted, CONFIG.jobs, async (entry) => {
     try {
-      links = await getDocumentLinks(resolved.uuid, entry.docketEntryUUID);
+      return await getDocumentLinks(resolved.uuid, entry.docketEntryUUID);
     } catch (e) {
       progress(`  ERROR listing documents for "${entry.description}": ${e.message}`);
-      continue;
+      return null;
     }
+  });
+
+  const jobs = [];
+  wanted.forEach((entry, idx) => {
+    const links = linkLists[idx];
+    if (!links) return;
     if (links.length === 0) {
       debug(`  No document links for "${entry.description}"`);
-      continue;
+      return;
     }
 
+    // Same for every document in the entry; classify it once.
+    const briefType = abbreviateBriefType(entry.description, entry.subtype);
     for (const link of links) {
       // Build a unique filename; multiple documents in one entry (or repeated
       // type+docketId) get a numeric suffix.
-      const key = `${caseNumber}_${entry.docketId}_${abbreviateBriefType(entry.description, entry.subtype)}`;
+      const key = `${caseNumber}_${entry.docketId}_${briefType}`;
       const count = (downloadedBriefs.get(key) || 0) + 1;
       downloadedBriefs.set(key, count);
       const filename = generateFilename(
         caseNumber,
         entry.docketId,
-        entry.description,
-        count > 1 ? count : null,
-        entry.subtype
+        briefType,
+        count > 1 ? count : null
       );
+      jobs.push({ entry, link, filename });
+    }
+  });
 
-      let downloadUrl = null;
-      let downloadSize = null;
-      let success = false;
-      try {
-        const result = await downloadDocument(resolved.uuid, link.documentLinkUUID, filename);
-        downloadUrl = result.url;
-        downloadSize = result.size;
-        success = true;
-        downloaded++;
-        progress(`  Downloaded: ${filename} (${Math.round(result.size / 1024)} KB)`);
-      } catch (e) {
-        progress(`  ERROR downloading ${filename}: ${e.message}`);
-      }
-
-      manifest.push({
-        caseNumber,
-        caseName,
-        docketId: entry.docketId,
-        description: entry.description,
-        type: entry.type || null,
-        subtype: entry.subtype || null,
-        filename,
-        url: downloadUrl,
-        size: downloadSize,
-        success,
-      });
+  const results = await mapConcurrent(jobs, CONFIG.jobs, async ({ link, filename }) => {
+    try {
+      const result = await downloadDocument(resolved.uuid, link.documentLinkUUID, filename);
+      progress(`  Downloaded: ${filename} (${Math.round(result.size / 1024)} KB)`);
+      return result;
+    } catch (e) {
+      progress(`  ERROR downloading ${filename}: ${e.message}`);
+      return null;
     }
-  }
+  });
+
+  let downloaded = 0;
+  jobs.forEach(({ entry, filename }, idx) => {
+    const result = results[idx];
+    if (result) downloaded++;
+    manifest.push({
+      caseNumber,
+      caseName,
+      docketId: entry.docketId,
+      description: entry.description,
+      type: entry.type || null,
+      subtype: entry.subtype || null,
+      filename,
+      url: result ? result.url : null,
+      size: result ? result.size : null,
+      success: !!result,
+    });
+  });
 
   return downloaded;
 }
@@ -683,7 +748,7 @@ async function main() {
 
   if (manifest.length > 0) {
     const manifestPath = path.join(CONFIG.downloadDir, 'manifest.json');
-    fs.writeFileSync(manifestPath, JSON.stringify(manifest, null, 2) + '\n');
+    writeFileAtomic(manifestPath, JSON.stringify(manifest, null, 2) + '\n');
     progress(`\nManifest written to: ${manifestPath}`);
   }
 